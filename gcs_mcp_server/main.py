@@ -1,12 +1,276 @@
+from cachetools import TTLCache
 from fastmcp import FastMCP
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from google.cloud.storage.retry import DEFAULT_RETRY
 
 from google.api_core import exceptions
 from datetime import timedelta
+import asyncio
+import contextlib
+import functools
+import google.auth
+import google.auth.credentials
+import google.auth.transport.requests
+import google_crc32c
+import inspect
+import logging
 import os
+import requests
+import threading
+import typing
 
-mcp = FastMCP(name="MyEnhancedGCSMCPServer")
-storage_client = storage.Client()
+# Nothing else configures logging under `fastmcp run`; give this module's INFO messages a handler
+# without turning on INFO output from every library.
+logging.basicConfig()
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Transfers are verified with CRC32C; without the C extension checksumming is far slower than the network.
+if google_crc32c.implementation != "c":
+    logger.warning("google-crc32c is using its pure-Python fallback; upload and download checksums will be slow.")
+
+# One shared client so credentials and HTTP connections are reused across tool calls.
+# GCS_API_ENDPOINT can point it at a closer endpoint, e.g. https://storage.us-east1.rep.googleapis.com
+_api_endpoint = os.environ.get("GCS_API_ENDPOINT")
+storage_client = storage.Client(
+    client_options={"api_endpoint": _api_endpoint} if _api_endpoint else None,
+)
+
+# Files larger than this are transferred in parallel chunks instead of over a single connection.
+PARALLEL_TRANSFER_THRESHOLD = 32 * 1024 * 1024
+TRANSFER_CHUNK_SIZE = 32 * 1024 * 1024
+# Chunks run on threads: forking worker processes from this multithreaded server
+# would copy locks held by other threads into the children.
+TRANSFER_MAX_WORKERS = 8
+
+# Tools run on asyncio.to_thread's default executor, which has min(32, cpu + 4) threads.
+TOOL_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
+# requests keeps only 10 connections per host and discards the extras once they are
+# returned, so busier tools would keep opening new TLS connections. Size the pool for
+# every tool thread plus one chunked transfer. Skip this when google-auth has mounted
+# its mutual-TLS adapter, so client certificates are not silently dropped.
+if not storage_client._http.is_mtls:
+    storage_client._http.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_maxsize=TOOL_THREADS + TRANSFER_MAX_WORKERS),
+    )
+
+# GCS returns at most 1000 objects per list page.
+LIST_PAGE_SIZE = 1000
+
+# Partial-response masks: GCS serializes only the fields the metadata tools return.
+BUCKET_METADATA_FIELDS = "id,name,location,storageClass,timeCreated,updated,versioning"
+BLOB_METADATA_FIELDS = "name,bucket,size,contentType,updated,storageClass,crc32c,md5Hash"
+
+# The project's bucket names, refreshed in the background; None until the first fetch.
+BUCKET_LIST_REFRESH_SECONDS = 60
+_bucket_names = None
+# Invalidation bumps the generation so a fetch that started earlier cannot store a stale list.
+_bucket_names_generation = 0
+_bucket_names_lock = threading.Lock()
+
+# GCS accepts at most 100 calls in one batch request.
+BATCH_SIZE = 100
+
+_token_lock = threading.Lock()
+# cloud-platform credentials for IAM signBlob, created on first use; the client's own
+# credentials only carry devstorage scopes, which signBlob rejects.
+_signing_credentials = None
+
+# Short-lived cache for read-only listing/metadata results, keyed by (kind, bucket_name, ...).
+_cache = TTLCache(maxsize=1024, ttl=30)
+_cache_lock = threading.Lock()
+# Bumped by _invalidate_bucket so a fetch that started before a write does not cache its stale result.
+_cache_generations: dict[str, int] = {}
+
+
+def _cache_get(key):
+    """Returns (cached value or None, bucket generation to pass back to _cache_set)."""
+    with _cache_lock:
+        return _cache.get(key), _cache_generations.get(key[1], 0)
+
+
+def _cache_set(key, value, generation: int):
+    with _cache_lock:
+        if generation == _cache_generations.get(key[1], 0):
+            _cache[key] = value
+
+
+def _invalidate_bucket(bucket_name: str):
+    """Drops every cached entry for a bucket after it or its objects change."""
+    with _cache_lock:
+        _cache_generations[bucket_name] = _cache_generations.get(bucket_name, 0) + 1
+        for key in [key for key in _cache if key[1] == bucket_name]:
+            _cache.pop(key, None)
+
+
+# Maps an exception type to the message key a tool passes to gcs_tool; the first match along the MRO wins.
+_ERROR_KINDS = {
+    exceptions.NotFound: "not_found",
+    exceptions.Forbidden: "forbidden",
+    exceptions.Conflict: "conflict",
+    exceptions.PreconditionFailed: "precondition_failed",
+    FileNotFoundError: "file_not_found",
+}
+
+# Error message templates, formatted with the tool's arguments and the exception as {e}.
+_MESSAGES = {
+    "bucket_not_found": "Error: Bucket '{bucket_name}' not found.",
+    "bucket_or_blob_not_found": "Error: Bucket '{bucket_name}' or blob '{blob_name}' not found.",
+    "blob_not_found": "Error: Blob '{blob_name}' not found in bucket '{bucket_name}'.",
+    "copy_source_not_found": "Error: Source blob '{blob_name}' or destination bucket '{destination_bucket_name}' not found.",
+    "bucket_exists": "Error: Bucket '{bucket_name}' already exists.",
+    "file_not_found": "Error: Local file '{source_file_name}' not found.",
+    "forbidden": "Error: Permission denied. Details: {e}",
+    "list_buckets_forbidden": "Error: Permission denied to list buckets. Details: {e}",
+    "create_bucket_forbidden": "Error: Permission denied to create bucket. Details: {e}",
+    "delete_bucket_forbidden": "Error: Permission denied to delete bucket '{bucket_name}'. Details: {e}",
+    "rename_conflict": "Error: Blob '{blob_name}' was modified during the rename. Please retry.",
+    "unexpected": "An unexpected error occurred: {e}",
+}
+
+
+def _batched(items: list, size: int = BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _reload_fields(resource, fields: str):
+    """Reloads a bucket or blob, asking GCS for only the given fields.
+
+    reload() has no fields argument, so this issues the same GET with a fields mask.
+    Inside a batch the properties are filled in when the batch completes.
+    """
+    # Client._get_resource, _target_object and _set_properties are private
+    # google-cloud-storage APIs; requirements.txt pins the range they were tested on.
+    resource._set_properties(
+        storage_client._get_resource(resource.path, query_params={"fields": fields}, _target_object=resource)
+    )
+
+
+def _signing_kwargs() -> dict:
+    """Returns generate_signed_url arguments for the client's credentials.
+
+    Service-account keys sign locally. Token-only credentials such as the GCE
+    metadata server sign through IAM signBlob, one request per URL, with a
+    cloud-platform token that is refreshed only once it has expired.
+    """
+    global _signing_credentials
+    # Client._credentials is private, but it is the only way to reach the credentials the client resolved.
+    credentials = storage_client._credentials
+    if isinstance(credentials, google.auth.credentials.Signing):
+        return {"credentials": credentials}
+    with _token_lock:
+        if _signing_credentials is None:
+            _signing_credentials, _ = google.auth.default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+        if not _signing_credentials.valid:
+            _signing_credentials.refresh(google.auth.transport.requests.Request())
+        return {
+            "service_account_email": getattr(_signing_credentials, "service_account_email", None),
+            "access_token": _signing_credentials.token,
+        }
+
+
+def _batch_error(response) -> str:
+    """Extracts the error message from one failed sub-response of a batch request."""
+    try:
+        return response.json()["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        return f"HTTP {response.status_code}"
+
+
+def _blob_metadata(blob) -> dict:
+    return {
+        "name": blob.name,
+        "bucket": blob.bucket.name,
+        "size": blob.size,
+        "content_type": blob.content_type,
+        "updated": blob.updated.isoformat() if blob.updated else None,
+        "storage_class": blob.storage_class,
+        "crc32c": blob.crc32c,
+        "md5_hash": blob.md5_hash,
+    }
+
+
+def _error_result(return_type, message: str):
+    """Wraps an error message in the same shape as the tool's normal result."""
+    if return_type is list:
+        return [message]
+    if return_type is dict:
+        return {"error": message.removeprefix("Error: ")}
+    return message
+
+
+def gcs_tool(**messages):
+    """Turns a blocking GCS function into an async tool with shared error handling.
+
+    The function runs in a worker thread, because google-cloud-storage is
+    synchronous and would otherwise stall every other MCP request on the event
+    loop. Exceptions are mapped through _ERROR_KINDS to an error kind, and
+    messages maps each kind to the key of its template in _MESSAGES.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        return_type = typing.get_origin(signature.return_annotation) or signature.return_annotation
+
+        def call(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                kind = next((_ERROR_KINDS[cls] for cls in type(e).__mro__ if cls in _ERROR_KINDS), None)
+                arguments = signature.bind(*args, **kwargs)
+                arguments.apply_defaults()
+                message = _MESSAGES[messages.get(kind, "unexpected")].format(e=e, **arguments.arguments)
+                return _error_result(return_type, message)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await asyncio.to_thread(call, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _fetch_bucket_names() -> list[str]:
+    global _bucket_names
+    with _bucket_names_lock:
+        generation = _bucket_names_generation
+    bucket_names = [bucket.name for bucket in storage_client.list_buckets()]
+    with _bucket_names_lock:
+        if generation == _bucket_names_generation:
+            _bucket_names = bucket_names
+    return bucket_names
+
+
+def _invalidate_bucket_names():
+    global _bucket_names, _bucket_names_generation
+    with _bucket_names_lock:
+        _bucket_names_generation += 1
+        _bucket_names = None
+
+
+async def _refresh_bucket_names():
+    while True:
+        try:
+            await asyncio.to_thread(_fetch_bucket_names)
+        except Exception:
+            logger.exception("Failed to refresh the bucket list")
+        await asyncio.sleep(BUCKET_LIST_REFRESH_SECONDS)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Logs the registered tool count and keeps the bucket list warm while the server runs."""
+    logger.info("Serving %d tools", len(await server.list_tools()))
+    refresh_task = asyncio.create_task(_refresh_bucket_names())
+    try:
+        yield {}
+    finally:
+        refresh_task.cancel()
+
+
+mcp = FastMCP(name="MyEnhancedGCSMCPServer", lifespan=lifespan)
 
 # ---------------------------------------------------------
 # 1️⃣ Simple Greeting
@@ -20,241 +284,233 @@ def greet(name: str) -> str:
 # 2️⃣ List all GCS buckets
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(forbidden="list_buckets_forbidden")
 def list_gcs_buckets() -> list[str]:
     """Lists all GCS buckets in the project."""
-    try:
-        storage_client = storage.Client()
-        buckets = storage_client.list_buckets()
-        return [bucket.name for bucket in buckets]
-    except exceptions.Forbidden as e:
-        return [f"Error: Permission denied to list buckets. Details: {e}"]
-    except Exception as e:
-        return [f"An unexpected error occurred: {e}"]
+    bucket_names = _bucket_names
+    if bucket_names is None:
+        bucket_names = _fetch_bucket_names()
+    return list(bucket_names)
 
 # ---------------------------------------------------------
 # 3️⃣ Create a new bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(conflict="bucket_exists", forbidden="create_bucket_forbidden")
 def create_bucket(bucket_name: str, location: str = "US") -> str:
     """Creates a new GCS bucket. Bucket names must be globally unique."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        bucket.location = location
-        storage_client.create_bucket(bucket)
-        return f"Bucket '{bucket_name}' created successfully in location '{location}'."
-    except exceptions.Conflict:
-        return f"Error: Bucket '{bucket_name}' already exists."
-    except exceptions.Forbidden as e:
-        return f"Error: Permission denied to create bucket. Details: {e}"
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    bucket.location = location
+    storage_client.create_bucket(bucket)
+    _invalidate_bucket(bucket_name)
+    _invalidate_bucket_names()
+    return f"Bucket '{bucket_name}' created successfully in location '{location}'."
 
 # ---------------------------------------------------------
 # 4️⃣ Delete a bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_not_found", forbidden="delete_bucket_forbidden")
 def delete_bucket(bucket_name: str) -> str:
     """Deletes a GCS bucket. The bucket must be empty unless force is used."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        # force=True deletes the bucket even if it contains objects. Use with caution.
-        bucket.delete(force=True)
-        return f"Bucket '{bucket_name}' deleted successfully."
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' not found."
-    except exceptions.Forbidden as e:
-        return f"Error: Permission denied to delete bucket '{bucket_name}'. Details: {e}"
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    # force=True deletes the bucket even if it contains objects. Use with caution.
+    bucket.delete(force=True)
+    _invalidate_bucket(bucket_name)
+    _invalidate_bucket_names()
+    return f"Bucket '{bucket_name}' deleted successfully."
 
 # ---------------------------------------------------------
 # 5️⃣ List objects in a bucket
 # ---------------------------------------------------------
 @mcp.tool
-def list_objects(bucket_name: str) -> list[str]:
-    """Lists all objects in a specified GCS bucket."""
-    try:
-        storage_client = storage.Client()
-        blobs = storage_client.list_blobs(bucket_name)
-        return [blob.name for blob in blobs]
-    except exceptions.NotFound:
-        return [f"Error: Bucket '{bucket_name}' not found."]
-    except Exception as e:
-        return [f"An unexpected error occurred: {e}"]
+@gcs_tool(not_found="bucket_not_found")
+def list_objects(bucket_name: str, prefix: str = "", page_token: str | None = None, max_results: int = LIST_PAGE_SIZE) -> dict:
+    """Lists one page of objects in a GCS bucket.
+
+    max_results is clamped to 1..1000 so a call never walks more than one page.
+    Pass the returned next_page_token back as page_token to fetch the next page;
+    it is None once the listing is complete.
+    """
+    # list_blobs() treats max_results as a total across pages, so a large value would list the whole bucket.
+    max_results = max(1, min(max_results, LIST_PAGE_SIZE))
+    cache_key = ("list_objects", bucket_name, prefix, page_token, max_results)
+    cached, generation = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    blobs = storage_client.list_blobs(
+        bucket_name,
+        prefix=prefix or None,
+        page_token=page_token,
+        max_results=max_results,
+        fields="items(name),nextPageToken",
+    )
+    names = [blob.name for blob in blobs]
+    result = {"names": names, "next_page_token": blobs.next_page_token}
+    _cache_set(cache_key, result, generation)
+    return result
 
 # ---------------------------------------------------------
 # 6️⃣ Upload file to a bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(file_not_found="file_not_found", not_found="bucket_not_found", forbidden="forbidden")
 def upload_blob(bucket_name: str, source_file_name: str, destination_blob_name: str) -> str:
     """Uploads a local file to a GCS bucket."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(destination_blob_name)
-        blob.upload_from_filename(source_file_name)
-        return f"File '{source_file_name}' uploaded to '{destination_blob_name}' in bucket '{bucket_name}'."
-    except FileNotFoundError:
-        return f"Error: Local file '{source_file_name}' not found."
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' not found."
-    except exceptions.Forbidden as e:
-        return f"Error: Permission denied. Details: {e}"
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    blob = bucket.blob(destination_blob_name)
+    size = os.path.getsize(source_file_name)
+    # Integrity is checked with CRC32C (hardware-accelerated via google-crc32c), never MD5.
+    if size > PARALLEL_TRANSFER_THRESHOLD:
+        transfer_manager.upload_chunks_concurrently(
+            source_file_name,
+            blob,
+            chunk_size=TRANSFER_CHUNK_SIZE,
+            worker_type=transfer_manager.THREAD,
+            max_workers=TRANSFER_MAX_WORKERS,
+            checksum="crc32c",
+        )
+    else:
+        # upload_from_filename already sends the file's size and a guessed content type,
+        # so files up to 8 MiB go out as a single multipart request.
+        blob.upload_from_filename(source_file_name, checksum="crc32c")
+    _invalidate_bucket(bucket_name)
+    return f"File '{source_file_name}' uploaded to '{destination_blob_name}' in bucket '{bucket_name}'."
 
 # ---------------------------------------------------------
 # 7️⃣ Download file from a bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_or_blob_not_found")
 def download_blob(bucket_name: str, blob_name: str, destination_file_name: str) -> str:
     """Downloads a blob from a GCS bucket to a local file."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-        blob.download_to_filename(destination_file_name)
-        return f"Blob '{blob_name}' downloaded to '{destination_file_name}'."
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' or blob '{blob_name}' not found."
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+    blob.reload()
+    if blob.size > PARALLEL_TRANSFER_THRESHOLD:
+        transfer_manager.download_chunks_concurrently(
+            blob,
+            destination_file_name,
+            chunk_size=TRANSFER_CHUNK_SIZE,
+            worker_type=transfer_manager.THREAD,
+            max_workers=TRANSFER_MAX_WORKERS,
+            crc32c_checksum=True,
+        )
+    else:
+        blob.download_to_filename(destination_file_name, checksum="crc32c")
+    return f"Blob '{blob_name}' downloaded to '{destination_file_name}'."
 
 # ---------------------------------------------------------
 # 8️⃣ Delete file from a bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_or_blob_not_found", forbidden="forbidden")
 def delete_blob(bucket_name: str, blob_name: str) -> str:
     """Deletes a blob from a GCS bucket."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-        blob.delete()
-        return f"Blob '{blob_name}' deleted from bucket '{bucket_name}'."
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' or blob '{blob_name}' not found."
-    except exceptions.Forbidden as e:
-        return f"Error: Permission denied. Details: {e}"
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+    blob.delete()
+    _invalidate_bucket(bucket_name)
+    return f"Blob '{blob_name}' deleted from bucket '{bucket_name}'."
 
 # ---------------------------------------------------------
 # 9️⃣ Get bucket metadata
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_not_found")
 def get_bucket_metadata(bucket_name: str) -> dict:
     """Retrieves metadata for a GCS bucket."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        return {
-            "id": bucket.id,
-            "name": bucket.name,
-            "location": bucket.location,
-            "storage_class": bucket.storage_class,
-            "created": bucket.time_created.isoformat() if bucket.time_created else None,
-            "updated": bucket.updated.isoformat() if bucket.updated else None,
-            "versioning_enabled": bucket.versioning_enabled,
-        }
-    except exceptions.NotFound:
-        return {"error": f"Bucket '{bucket_name}' not found."}
-    except Exception as e:
-        return {"error": f"An unexpected error occurred: {e}"}
+    cache_key = ("bucket_metadata", bucket_name)
+    cached, generation = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+    bucket = storage_client.bucket(bucket_name)
+    _reload_fields(bucket, BUCKET_METADATA_FIELDS)
+    result = {
+        "id": bucket.id,
+        "name": bucket.name,
+        "location": bucket.location,
+        "storage_class": bucket.storage_class,
+        "created": bucket.time_created.isoformat() if bucket.time_created else None,
+        "updated": bucket.updated.isoformat() if bucket.updated else None,
+        "versioning_enabled": bucket.versioning_enabled,
+    }
+    _cache_set(cache_key, result, generation)
+    return result
 
 # ---------------------------------------------------------
 # 🔟 Get object metadata
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="blob_not_found")
 def get_blob_metadata(bucket_name: str, blob_name: str) -> dict:
     """Retrieves metadata for a specific object in a bucket."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.get_blob(blob_name)
-        if not blob:
-            return {"error": f"Blob '{blob_name}' not found in bucket '{bucket_name}'."}
-        return {
-            "name": blob.name,
-            "bucket": blob.bucket.name,
-            "size": blob.size,
-            "content_type": blob.content_type,
-            "updated": blob.updated.isoformat() if blob.updated else None,
-            "storage_class": blob.storage_class,
-            "crc32c": blob.crc32c,
-            "md5_hash": blob.md5_hash,
-        }
-    except exceptions.NotFound:
-        return {"error": f"Bucket '{bucket_name}' not found."}
-    except Exception as e:
-        return {"error": f"An unexpected error occurred: {e}"}
+    blob = storage_client.bucket(bucket_name).blob(blob_name)
+    _reload_fields(blob, BLOB_METADATA_FIELDS)
+    return _blob_metadata(blob)
 
 # ---------------------------------------------------------
 # 11️⃣ Generate signed URL
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_not_found")
 def generate_signed_url(bucket_name: str, blob_name: str, expiration_minutes: int = 15) -> str:
     """Generates a signed URL for temporary access to a blob"""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-        
-        if not blob.exists():
-             return f"Error: Blob '{blob_name}' not found in bucket '{bucket_name}'."
-
-        url = blob.generate_signed_url(expiration=timedelta(minutes=expiration_minutes))
-        return url
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' not found."
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+    # No existence check: a missing blob surfaces as a 404 when the URL is used.
+    # Signed URLs go to outside callers, so keep them on the public host when
+    # GCS_API_ENDPOINT points the client at a private or regional endpoint. Without
+    # the override the library picks the host itself (emulator, universe_domain).
+    endpoint_kwargs = {"api_access_endpoint": "https://storage.googleapis.com"} if _api_endpoint else {}
+    url = blob.generate_signed_url(
+        version="v4",
+        expiration=timedelta(minutes=expiration_minutes),
+        **endpoint_kwargs,
+        **_signing_kwargs(),
+    )
+    return url
 
 # ---------------------------------------------------------
 # 12️⃣ Rename or move an object
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_or_blob_not_found", precondition_failed="rename_conflict")
 def rename_blob(bucket_name: str, blob_name: str, new_name: str) -> str:
     """Renames a blob (object) within a GCS bucket."""
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(bucket_name)
-        blob = bucket.blob(blob_name)
-        if not blob.exists():
-            return f"Error: Source blob '{blob_name}' not found."
-        new_blob = bucket.rename_blob(blob, new_name)
-        return f"Blob '{blob_name}' renamed to '{new_blob.name}' in bucket '{bucket_name}'."
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' or blob '{blob_name}' not found."
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+    # Rename is a copy followed by a delete; pinning the source generation keeps a
+    # concurrent overwrite from being copied or deleted halfway through.
+    _reload_fields(blob, "name,generation")
+    new_blob = bucket.rename_blob(blob, new_name, if_source_generation_match=blob.generation)
+    _invalidate_bucket(bucket_name)
+    return f"Blob '{blob_name}' renamed to '{new_blob.name}' in bucket '{bucket_name}'."
 
 # ---------------------------------------------------------
 # 13️⃣ Copy object to another bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="copy_source_not_found")
 def copy_blob(source_bucket_name: str, blob_name: str, destination_bucket_name: str, destination_blob_name: str) -> str:
     """Copies an object from one GCS bucket to another."""
-    try:
-        storage_client = storage.Client()
-        source_bucket = storage_client.bucket(source_bucket_name)
-        destination_bucket = storage_client.bucket(destination_bucket_name)
-        blob = source_bucket.blob(blob_name)
-        if not blob.exists():
-            return f"Error: Source blob '{blob_name}' not found in bucket '{source_bucket_name}'."
-        source_bucket.copy_blob(blob, destination_bucket, destination_blob_name)
-        return f"Blob '{blob_name}' copied to '{destination_blob_name}' in bucket '{destination_bucket_name}'."
-    except exceptions.NotFound:
-        return f"Error: Source or destination bucket not found."
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    blob = storage_client.bucket(source_bucket_name).blob(blob_name)
+    destination_blob = storage_client.bucket(destination_bucket_name).blob(destination_blob_name)
+    # Rewrite handles objects of any size across locations and storage classes;
+    # each call copies a slice server-side and returns a token to continue from.
+    token, _, _ = destination_blob.rewrite(blob)
+    while token is not None:
+        # The library only retries rewrites with a generation precondition, but resending
+        # the same token is idempotent, so a transient error doesn't restart the copy.
+        token, _, _ = destination_blob.rewrite(blob, token=token, retry=DEFAULT_RETRY)
+    _invalidate_bucket(destination_bucket_name)
+    return f"Blob '{blob_name}' copied to '{destination_blob_name}' in bucket '{destination_bucket_name}'."
 
 # ---------------------------------------------------------
 # 14️⃣ Set CORS configuration for a bucket
 # ---------------------------------------------------------
 @mcp.tool
+@gcs_tool(not_found="bucket_not_found")
 def set_bucket_cors(bucket_name: str, cors_rules: list[dict]) -> str:
     """Sets the CORS configuration for a bucket.
 
@@ -270,16 +526,11 @@ def set_bucket_cors(bucket_name: str, cors_rules: list[dict]) -> str:
                         }
                     ]
     """
-    try:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        bucket.cors = cors_rules
-        bucket.patch()
-        return f"CORS configuration updated for bucket '{bucket_name}'."
-    except exceptions.NotFound:
-        return f"Error: Bucket '{bucket_name}' not found."
-    except Exception as e:
-        return f"An unexpected error occurred: {e}"
+    bucket = storage_client.get_bucket(bucket_name)
+    bucket.cors = cors_rules
+    bucket.patch()
+    _invalidate_bucket(bucket_name)
+    return f"CORS configuration updated for bucket '{bucket_name}'."
 
 # ---------------------------------------------------------
 # 15️⃣ Health Check
@@ -288,3 +539,49 @@ def set_bucket_cors(bucket_name: str, cors_rules: list[dict]) -> str:
 def health_check() -> str:
     """Returns a simple health check message."""
     return "Server is up and running!"
+
+# ---------------------------------------------------------
+# 16️⃣ Delete many objects in batched requests
+# ---------------------------------------------------------
+@mcp.tool
+@gcs_tool(not_found="bucket_not_found")
+def delete_blobs(bucket_name: str, blob_names: list[str]) -> dict:
+    """Deletes several blobs from a bucket, sending up to 100 deletions per HTTP request."""
+    bucket = storage_client.bucket(bucket_name)
+    deleted, errors = [], {}
+    for chunk in _batched(blob_names):
+        batch = storage_client.batch(raise_exception=False)
+        with batch:
+            for name in chunk:
+                bucket.blob(name).delete()
+        # Batch._responses is private; requirements.txt pins the google-cloud-storage range it was tested on.
+        for name, response in zip(chunk, batch._responses):
+            if response.ok:
+                deleted.append(name)
+            else:
+                errors[name] = _batch_error(response)
+    _invalidate_bucket(bucket_name)
+    return {"deleted": deleted, "errors": errors}
+
+# ---------------------------------------------------------
+# 17️⃣ Get metadata for many objects in batched requests
+# ---------------------------------------------------------
+@mcp.tool
+@gcs_tool(not_found="bucket_not_found")
+def get_blobs_metadata(bucket_name: str, blob_names: list[str]) -> dict:
+    """Retrieves metadata for several objects, sending up to 100 lookups per HTTP request."""
+    bucket = storage_client.bucket(bucket_name)
+    blobs, errors = [], {}
+    for chunk in _batched(blob_names):
+        chunk_blobs = [bucket.blob(name) for name in chunk]
+        batch = storage_client.batch(raise_exception=False)
+        with batch:
+            for blob in chunk_blobs:
+                _reload_fields(blob, BLOB_METADATA_FIELDS)
+        # Batch._responses is private (see delete_blobs).
+        for blob, response in zip(chunk_blobs, batch._responses):
+            if response.ok:
+                blobs.append(_blob_metadata(blob))
+            else:
+                errors[blob.name] = _batch_error(response)
+    return {"blobs": blobs, "errors": errors}